@@ -1,39 +1,60 @@
+from typing import Callable, List
+
 import pandas as pd
 import tensorflow as tf
 
-from data_handlers.preprocessing import paper_preprocessing, paper_preprocessing_validation
+from data_handlers.preprocessing import compose_preprocessing, paper_preprocessing, paper_preprocessing_batch, \
+    paper_preprocessing_validation
 
 AUTOTUNE = tf.data.experimental.AUTOTUNE
 X_COLUMN = 'x_col'
 Y_COLUMN = 'y_col'
+GPU_DEVICE = '/GPU:0'
 
 
 def custom_data_loading(
         train_info: pd.DataFrame,
-        validation_info: pd.DataFrame
+        validation_info: pd.DataFrame,
+        preprocessing_functions: List[Callable[[tf.Tensor], tf.Tensor]] = None
 ):
     """
     Load training and validation dataset. Assumes standardized dataset.
 
     :param train_info: pd.DataFrame containing information about the location of the training dataset.
     :param validation_info: pd.DataFrame containing information about the location of the validation dataset.
+    :param preprocessing_functions: Optional custom preprocessing functions applied to each training image before the
+        augmentation from the paper.
 
     :return: Tuple of tf.data.Dataset for training and validation.
     """
-    # Could be batched earlier for performance improvement.
     train_dataset = tf.data.Dataset.from_tensor_slices((train_info['x_col'], train_info['y_col']))
     train_dataset = train_dataset.shuffle(100000)
     train_dataset = train_dataset.map(read_images, num_parallel_calls=AUTOTUNE)
+    if preprocessing_functions:
+        train_dataset = train_dataset.map(
+            compose_preprocessing(preprocessing_functions),
+            num_parallel_calls=AUTOTUNE
+        )
     train_dataset = train_dataset.map(paper_preprocessing, num_parallel_calls=AUTOTUNE)
     train_dataset = train_dataset.batch(32, drop_remainder=True)
+    train_dataset = train_dataset.map(paper_preprocessing_batch, num_parallel_calls=AUTOTUNE)
     train_dataset = train_dataset.prefetch(AUTOTUNE)
     validation_dataset = tf.data.Dataset \
         .from_tensor_slices((validation_info['x_col'], validation_info['y_col'])) \
         .map(read_images, num_parallel_calls=AUTOTUNE) \
-        .map(paper_preprocessing_validation, num_parallel_calls=AUTOTUNE) \
         .batch(32, drop_remainder=True) \
+        .map(paper_preprocessing_validation, num_parallel_calls=AUTOTUNE) \
         .prefetch(AUTOTUNE)
-    return train_dataset, validation_dataset
+    return _prefetch_to_gpu(train_dataset), _prefetch_to_gpu(validation_dataset)
+
+
+def _prefetch_to_gpu(
+        dataset: tf.data.Dataset
+) -> tf.data.Dataset:
+    # Copies the next batches to the GPU while the current step runs. Must be the last transformation.
+    if not tf.config.experimental.list_physical_devices('GPU'):
+        return dataset
+    return dataset.apply(tf.data.experimental.prefetch_to_device(GPU_DEVICE, buffer_size=2))
 
 
 @tf.function
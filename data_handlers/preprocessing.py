@@ -1,31 +1,30 @@
-from typing import Callable, List
+from typing import Callable, List, Tuple
 
 import numpy as np
 import tensorflow as tf
 import tensorflow_addons as tfa
-from PIL import Image
 
 
-def process_custom_preprocessing(
-        preprocessing_functions: List[Callable[[np.array], np.array]]
-) -> Callable[[np.array], np.array]:
+def compose_preprocessing(
+        preprocessing_functions: List[Callable[[tf.Tensor], tf.Tensor]]
+) -> Callable[[tf.Tensor, tf.Tensor], Tuple[tf.Tensor, tf.Tensor]]:
     """
-    Function for aggregating multiple custom preprocessing functions for a
-    tf.keras.preprocessing.image.ImageDataGenerator.
+    Function for aggregating multiple custom preprocessing functions into a single function that can be mapped over a
+    tf.data.Dataset of (image, label) pairs.
 
-    :param preprocessing_functions: List of custom preprocessing functions.
+    :param preprocessing_functions: List of custom preprocessing functions composed of TensorFlow operations.
 
     :return: Aggregate preprocessing function processing all functionality from the passed functions.
     """
-    def _process_custom_preprocessing(
-            image: np.array
-    ) -> np.array:
-        processed_image = image.copy()
+    def _compose_preprocessing(
+            image: tf.Tensor,
+            label: tf.Tensor
+    ) -> Tuple[tf.Tensor, tf.Tensor]:
         for preprocessing_function in preprocessing_functions:
-            processed_image = preprocessing_function(processed_image)
-        return processed_image
+            image = preprocessing_function(image)
+        return image, label
 
-    return _process_custom_preprocessing
+    return _compose_preprocessing
 
 
 @tf.function
@@ -33,8 +32,8 @@ def paper_preprocessing(img, label):
     # crop
     icut = 256 - 227
     jcut = 256 - 227
-    ioff = np.random.randint(0, icut + 1)
-    joff = np.random.randint(0, jcut + 1)
+    ioff = tf.random.uniform([], 0, icut + 1, dtype=tf.int32)
+    joff = tf.random.uniform([], 0, jcut + 1, dtype=tf.int32)
     img = img[ioff: ioff + 256 - icut, joff: joff + 256 - jcut]
 
     # adjust color
@@ -47,45 +46,53 @@ def paper_preprocessing(img, label):
     )
 
     # mirror
-    if tf.random.uniform([1])[0] < 0.5:
-        img = img[:, ::-1]
-    image_size = [227, 227]
+    img = tf.cond(
+        tf.random.uniform([]) < 0.5,
+        lambda: tf.image.flip_left_right(img),
+        lambda: img
+    )
 
-    # scaling
-    if tf.random.uniform([1])[0] < 0.5:
+    return img, label
 
-        iscale = 2 * (tf.random.uniform([1])[0] - 0.5) * 0.10 + 1.0
-        jscale = 2 * (tf.random.uniform([1])[0] - 0.5) * 0.10 + 1.0
 
-        image_size = [int(227 * iscale), int(227 * jscale)]
-        img = tf.image.resize(
-            images=img,
-            size=image_size,
-            method=tf.image.ResizeMethod.BICUBIC
-        )
+@tf.function
+def paper_preprocessing_batch(images, labels):
+    batch_size = tf.shape(images)[0]
 
-    # rotate small degree
-    if tf.random.uniform([1])[0] < 0.9:
-        rotate_angle = (tf.random.uniform([1])[0] - 0.5) * 2 * 20.0
-        img = tfa.image.rotate(img, rotate_angle * np.pi / 180.)
+    # scaling
+    scale = 2 * (tf.random.uniform([batch_size, 2]) - 0.5) * 0.10 + 1.0
+    scale = tf.where(tf.random.uniform([batch_size, 1]) < 0.5, scale, 1.0)
 
-    img = zero_centering(img, image_size)
+    # rotate small degree
+    rotate_angle = (tf.random.uniform([batch_size]) - 0.5) * 2 * 20.0
+    rotate_angle = tf.where(tf.random.uniform([batch_size]) < 0.9, rotate_angle * np.pi / 180., 0.0)
+
+    # scaling and rotation around the image center, zero padded to 227 x 227
+    images = tfa.image.transform(
+        images=images,
+        transforms=_scale_rotate_transforms(scale, rotate_angle, 227),
+        interpolation='BILINEAR',
+        output_shape=[227, 227]
+    )
 
-    img = (img - 127.0) / 127.0
+    images = images * (1.0 / 127.0) - 1.0
 
-    return img, label
+    return images, labels
 
 
-def zero_centering(img, image_size):
-    if image_size[0] < 227:
-        img = tf.image.pad_to_bounding_box(img, (227 - image_size[0]) // 2, 0, 227, image_size[1])
-        image_size[0] = 227
-    if image_size[1] < 227:
-        img = tf.image.pad_to_bounding_box(img, 0, (227 - image_size[1]) // 2, image_size[0], 227)
-        image_size[1] = 227
-    x0 = (image_size[0] - 227) // 2
-    y0 = (image_size[1] - 227) // 2
-    return tf.image.crop_to_bounding_box(img, x0, y0, 227, 227)
+def _scale_rotate_transforms(scale, angle, size):
+    # projective transforms mapping output to input pixels, inverse of scaling followed by rotation
+    center = (size - 1) / 2.
+    cos = tf.cos(angle)
+    sin = tf.sin(angle)
+    a0 = cos / scale[:, 1]
+    a1 = -sin / scale[:, 1]
+    b0 = sin / scale[:, 0]
+    b1 = cos / scale[:, 0]
+    a2 = center - a0 * center - a1 * center
+    b2 = center - b0 * center - b1 * center
+    zeros = tf.zeros_like(angle)
+    return tf.stack([a0, a1, a2, b0, b1, b2, zeros, zeros], axis=1)
 
 
 def inverse_transform(X):
@@ -93,30 +100,25 @@ def inverse_transform(X):
 
 
 def rotate_img(x):
-    rotate_angle = (np.random.rand(1)[0] - 0.5) * 2 * 20.0
-    im = Image.fromarray(x.astype(np.uint8))
-    x = np.array(im.rotate(rotate_angle, Image.BICUBIC)).astype(np.float32)
-    return x
+    rotate_angle = (tf.random.uniform([]) - 0.5) * 2 * 20.0
+    return tfa.image.rotate(tf.cast(x, tf.float32), rotate_angle * np.pi / 180., interpolation='BILINEAR')
 
 
 def paper_preprocessing_validation(img, label):
-    # crop
+    # crop and normalize in one pass, works on single images as well as batches
     icut = 256 - 227
     jcut = 256 - 227
     ioff = int(icut // 2)
     joff = int(jcut // 2)
-    img = img[ioff: ioff + 256 - icut, joff: joff + 256 - jcut]
-
-    img = tf.cast(img, tf.float32)
-
-    img = (img - 127.0) / 127.0
+    img = tf.image.crop_to_bounding_box(img, ioff, joff, 227, 227)
+    img = tf.cast(img, tf.float32) * (1.0 / 127.0) - 1.0
 
     return img, label
 
 
 def adjust_aspect_ratio(
         aspect_ratio_range: float
-) -> Callable[[np.array], np.array]:
+) -> Callable[[tf.Tensor], tf.Tensor]:
     """
     Returns a function that adjusts the aspect ration of an image by a percentage specified with aspect_ratio_range.
 
@@ -126,37 +128,28 @@ def adjust_aspect_ratio(
     :return: A function that adjusts the input image to the new aspect ratio and pads the output to the original shape.
     """
     def _adjust_aspect_ratio(
-            image: np.array
-    ) -> np.array:
-        if image.ndim != 3:
+            image: tf.Tensor
+    ) -> tf.Tensor:
+        if image.shape.ndims != 3:
             raise ValueError('Input image must have rank 3.')
-        if image.shape[0] != image.shape[1]:
-            raise ValueError('Input image must be squared.')
-
-        aspect_ratio = 1. + (np.random.uniform(-aspect_ratio_range, aspect_ratio_range) / 100.)
-        if aspect_ratio < 1:
-            target_width = int(image.shape[1] * aspect_ratio)
-            target_height = image.shape[0]
-        else:
-            target_width = image.shape[1]
-            target_height = int(image.shape[0] / aspect_ratio)
-        mask = np.pad(
-            array=np.ones((target_height, target_width, image.shape[2])),
-            pad_width=[
-                (int(np.ceil((image.shape[0] - target_height) / 2)), (image.shape[0] - target_height) // 2),
-                (int(np.ceil((image.shape[1] - target_width) / 2)), (image.shape[1] - target_width) // 2),
-                (0, 0)
-            ],
-            constant_values=0
-        )
-        return np.where(mask, image, 0)
+        height = tf.shape(image)[0]
+        width = tf.shape(image)[1]
+        tf.debugging.assert_equal(height, width, message='Input image must be squared.')
+
+        aspect_ratio = 1. + (tf.random.uniform([], -aspect_ratio_range, aspect_ratio_range) / 100.)
+        target_height = tf.minimum(height, tf.cast(tf.cast(height, tf.float32) / aspect_ratio, tf.int32))
+        target_width = tf.minimum(width, tf.cast(tf.cast(width, tf.float32) * aspect_ratio, tf.int32))
+        offset_height = (height - target_height + 1) // 2
+        offset_width = (width - target_width + 1) // 2
+        image = tf.image.crop_to_bounding_box(image, offset_height, offset_width, target_height, target_width)
+        return tf.image.pad_to_bounding_box(image, offset_height, offset_width, height, width)
 
     return _adjust_aspect_ratio
 
 
 def crop_to_central_image(
         central_fraction: float
-) -> Callable[[np.array], np.array]:
+) -> Callable[[tf.Tensor], tf.Tensor]:
     """
     Returns a function that crops an image to the specified fraction of the original image. The crop is taken from the
     center of the original image.
@@ -168,8 +161,8 @@ def crop_to_central_image(
     central_fraction = central_fraction / 100.
 
     def _crop_to_central_image(
-            image: np.array
-    ) -> np.array:
+            image: tf.Tensor
+    ) -> tf.Tensor:
         return tf.image.central_crop(
             image=image,
             central_fraction=central_fraction
@@ -180,7 +173,7 @@ def crop_to_central_image(
 
 def rescale_image(
         target_size: List
-) -> Callable[[np.array], np.array]:
+) -> Callable[[tf.Tensor], tf.Tensor]:
     """
     Returns a function that rescales an image to the specified target resolution.
 
@@ -189,8 +182,8 @@ def rescale_image(
     :return: Rescaled image.
     """
     def _rescale_image(
-            image: np.array
-    ) -> np.array:
+            image: tf.Tensor
+    ) -> tf.Tensor:
         return tf.image.resize(
             images=image,
             size=target_size
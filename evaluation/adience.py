@@ -1,8 +1,8 @@
 from pathlib import Path
 from typing import List, Callable, Union, Type
 
+import tensorflow as tf
 from tensorflow.keras.activations import linear, softmax
-from tensorflow.keras.preprocessing.image import ImageDataGenerator
 
 from data_handlers.adience import get_adience_info, ADIENCE_TRAIN_FOLDS_INFO_FILES, \
     ADIENCE_VALIDATION_FOLDS_INFO_FILES, ADIENCE_CLASSES
@@ -73,8 +73,8 @@ def _evaluate_adience_fold(
 
 def _evaluate(
         model: EvaluationModel,
-        train_generator: ImageDataGenerator,
-        validation_generator: ImageDataGenerator
+        train_generator: tf.data.Dataset,
+        validation_generator: tf.data.Dataset
 ) -> None:
     model.train(
         x=train_generator,
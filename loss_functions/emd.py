@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable
 
@@ -29,20 +30,21 @@ def earth_mover_distance(
 
 def approximate_earth_mover_distance(
         entropic_regularizer: float,
-        distance_matrix: np.array,
+        distance_matrix: tf.Tensor,
         matrix_scaling_operations: int = 100,
         **kwargs
 ) -> Callable:
     """
     Wrapper for approximate earth mover distance.
     """
+    distance_matrix = tf.cast(distance_matrix, tf.float32)
+    k = tf.exp(-entropic_regularizer * distance_matrix)
+    km = k * distance_matrix
 
     def _approximate_earth_mover_distance(
             y_true: K.placeholder,
             y_pred: K.placeholder
     ) -> K.placeholder:
-        k = tf.exp(-entropic_regularizer * distance_matrix)
-        km = k * distance_matrix
         u = tf.ones(y_true.shape) / y_true.shape[1]
         for _ in range(matrix_scaling_operations):
             u = y_pred / ((y_true / (u @ k)) @ k)
@@ -57,21 +59,29 @@ class EmdWeightHeadStart(Callback):
 
     def __init__(self):
         super(EmdWeightHeadStart, self).__init__()
-        self.emd_weight = 0
-        self.epoch = 0
-        self.cross_entropy_loss_history = []
-        self.self_guided_emd_loss_history = []
+        self.emd_weight = tf.Variable(0., trainable=False)
+        self.epoch = tf.Variable(0, trainable=False)
+        self.cross_entropy_loss_sum = tf.Variable(0., trainable=False)
+        self.self_guided_emd_loss_sum = tf.Variable(0., trainable=False)
+        self.loss_count = tf.Variable(0., trainable=False)
 
     def on_epoch_begin(self, epoch, logs={}):
-        self.epoch = epoch
+        self.epoch.assign(epoch)
         if epoch == 4:
-            cross_entropy_loss = tf.reduce_mean(
-                tf.convert_to_tensor(self.cross_entropy_loss_history, dtype=tf.float32)
-            )
-            self_guided_emd_loss = tf.reduce_mean(
-                tf.convert_to_tensor(self.self_guided_emd_loss_history, dtype=tf.float32)
-            )
-            self.emd_weight = (cross_entropy_loss / self_guided_emd_loss) / 3.5
+            cross_entropy_loss = self.cross_entropy_loss_sum / self.loss_count
+            self_guided_emd_loss = self.self_guided_emd_loss_sum / self.loss_count
+            self.emd_weight.assign((cross_entropy_loss / self_guided_emd_loss) / 3.5)
+
+    def record_losses(
+            self,
+            cross_entropy_loss: K.placeholder,
+            self_guided_emd_loss: K.placeholder
+    ) -> K.placeholder:
+        """Accumulates the losses of the epoch before the head start ends and returns the cross entropy loss."""
+        self.cross_entropy_loss_sum.assign_add(tf.reduce_sum(cross_entropy_loss))
+        self.self_guided_emd_loss_sum.assign_add(tf.reduce_sum(self_guided_emd_loss))
+        self.loss_count.assign_add(tf.cast(tf.size(cross_entropy_loss), tf.float32))
+        return cross_entropy_loss
 
 
 class GroundDistanceManager(Callback):
@@ -82,7 +92,8 @@ class GroundDistanceManager(Callback):
             file_path: Path
     ):
         super(GroundDistanceManager, self).__init__()
-        self.ground_distance_matrix = None
+        self.ground_distance_matrix = tf.Variable(tf.zeros((8, 8)), trainable=False)
+        self.batch_class_features = tf.Variable(tf.zeros((0, 0)), shape=tf.TensorShape(None), trainable=False)
         self.epoch_class_features = []
         self.epoch_labels = []
         self.class_length = 8
@@ -95,7 +106,7 @@ class GroundDistanceManager(Callback):
         self.epoch_labels = labels_tensor
 
     def on_train_batch_end(self, batch, logs=None):
-        self.epoch_class_features.append(self.model.second_to_last_layer)
+        self.epoch_class_features.append(tf.identity(self.batch_class_features))
 
     def on_epoch_end(self, epoch, logs=None):
         self._update_ground_distance_matrix()
@@ -104,9 +115,9 @@ class GroundDistanceManager(Callback):
     def _update_ground_distance_matrix(self):
         self.epoch_class_features = tf.concat(self.epoch_class_features, axis=0)
         estimated_distances = self._estimate_distances()
-        self.ground_distance_matrix = self._calculate_ground_distances(
+        self.ground_distance_matrix.assign(self._calculate_ground_distances(
             estimated_distances=estimated_distances
-        )
+        ))
         self.epoch_class_features = []
 
     def _estimate_distances(self) -> K.placeholder:
@@ -147,11 +158,17 @@ class GroundDistanceManager(Callback):
     def _save_ground_distance_matrix(self, epoch: int) -> None:
         np.save(
             file=str(self.file_path) + f'/{epoch}',
-            arr=self.ground_distance_matrix
+            arr=self.ground_distance_matrix.numpy()
         )
 
-    def load_ground_distance_matrix(self, epoch) -> np.array:
-        return np.load(str(self.file_path) + f'/{epoch}.npy')
+
+@lru_cache(maxsize=None)
+def load_ground_distance_matrix(
+        file_path: Path,
+        epoch: str
+) -> tf.Tensor:
+    """Loads a ground distance matrix saved by the GroundDistanceManager once and caches it as a tensor."""
+    return tf.constant(np.load(str(file_path) + f'/{epoch}.npy'), dtype=tf.float32)
 
 
 def self_guided_earth_mover_distance(
@@ -169,47 +186,43 @@ def self_guided_earth_mover_distance(
             y_true=y_true,
             y_pred=y_pred
         )
-        if model.emd_weight_head_start.emd_weight == 0:
-            if model.emd_weight_head_start.epoch == 3:
-                self_guided_emd_loss = _calculate_self_guided_loss(
-                    y_true=y_true,
-                    y_pred=y_pred,
-                    ground_distance_sensitivity=ground_distance_sensitivity,
-                    ground_distance_bias=ground_distance_bias,
-                    ground_distance_manager=model.ground_distance_manager
-                )
-                model.emd_weight_head_start.cross_entropy_loss_history.append(cross_entropy_loss)
-                model.emd_weight_head_start.self_guided_emd_loss_history.append(self_guided_emd_loss)
-            return cross_entropy_loss
-        else:
-            self_guided_emd_loss = _calculate_self_guided_loss(
+        emd_weight_head_start = model.emd_weight_head_start
+
+        def _self_guided_emd_loss():
+            return _calculate_self_guided_loss(
                 y_true=y_true,
                 y_pred=y_pred,
                 ground_distance_sensitivity=ground_distance_sensitivity,
                 ground_distance_bias=ground_distance_bias,
-                ground_distance_manager=model.ground_distance_manager
+                ground_distance_matrix=model.ground_distance_manager.ground_distance_matrix
+            )
+
+        return tf.cond(
+            tf.logical_and(tf.equal(emd_weight_head_start.emd_weight, 0.), tf.equal(emd_weight_head_start.epoch, 3)),
+            lambda: emd_weight_head_start.record_losses(
+                cross_entropy_loss=cross_entropy_loss,
+                self_guided_emd_loss=_self_guided_emd_loss()
+            ),
+            lambda: tf.cond(
+                emd_weight_head_start.emd_weight > 0.,
+                lambda: cross_entropy_loss + emd_weight_head_start.emd_weight * _self_guided_emd_loss(),
+                lambda: cross_entropy_loss
             )
-            return cross_entropy_loss + model.emd_weight_head_start.emd_weight * self_guided_emd_loss
+        )
 
     return _self_guided_earth_mover_distance
 
 
+@tf.function(experimental_compile=True)
 def _calculate_self_guided_loss(
         y_true: K.placeholder,
         y_pred: K.placeholder,
         ground_distance_sensitivity: float,
         ground_distance_bias: float,
-        ground_distance_manager: GroundDistanceManager
+        ground_distance_matrix: tf.Variable
 ):
-    batch_size = 32
-    cost_vectors = []
-    for i in range(batch_size):
-        cost_vectors.append(
-            ground_distance_manager.ground_distance_matrix[:, K.argmax(y_true[i])]
-            ** ground_distance_sensitivity
-            + ground_distance_bias
-        )
-    cost_vectors = tf.stack(cost_vectors)
+    cost_vectors = tf.transpose(tf.gather(ground_distance_matrix, K.argmax(y_true, axis=-1), axis=1)) \
+        ** ground_distance_sensitivity + ground_distance_bias
     return K.sum(K.square(y_pred) * cost_vectors, axis=1)
 
 
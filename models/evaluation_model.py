@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import ClassVar, Callable, Union, List
 
+import tensorflow as tf
 from tensorflow.keras.metrics import Metric
 from tensorflow.keras import Model
 from tensorflow.keras.activations import linear, softmax
@@ -26,6 +27,7 @@ class EvaluationModel(ABC, Model):
         one_off_accuracy
     ]
     _MODEL_NAME: ClassVar[str] = 'base_model'
+    _DTYPE_POLICY: ClassVar[str] = 'mixed_float16'
     model: Model = None
 
     def __init__(
@@ -39,6 +41,7 @@ class EvaluationModel(ABC, Model):
             ground_distance_path: Path,
             **loss_function_kwargs,
     ):
+        tf.keras.mixed_precision.experimental.set_policy(self._DTYPE_POLICY)
         super(EvaluationModel, self).__init__()
         self.number_of_classes = number_of_classes
         self.learning_rate = learning_rate
@@ -46,13 +49,29 @@ class EvaluationModel(ABC, Model):
         self.dataset_name = dataset_name
         self.loss_function = loss_function
         self.second_to_last_layer = None
+        if loss_function == self_guided_earth_mover_distance:
+            self.emd_weight_head_start = EmdWeightHeadStart()
+            self.ground_distance_manager = GroundDistanceManager(ground_distance_path)
+        self.checkpoint_callback = get_checkpoint_file(
+            loss_name=self.loss_function.__name__,
+            data_set_name=self.dataset_name,
+            learning_rate=self.learning_rate,
+            model_name=self._MODEL_NAME,
+            fold_index=self.fold_index
+        )
+        self.tensorboard_callback = get_tensorboard_callback(
+            loss_name=self.loss_function.__name__,
+            data_set_name=self.dataset_name,
+            learning_rate=self.learning_rate,
+            model_name=self._MODEL_NAME,
+            fold_index=self.fold_index
+        )
 
         self._build_model(
             number_of_classes=number_of_classes,
             final_activation=final_activation
         )
         self._compile_model(
-            ground_distance_path=ground_distance_path,
             loss_function=loss_function,
             **loss_function_kwargs
         )
@@ -87,15 +106,18 @@ class EvaluationModel(ABC, Model):
         else:
             return output
 
+    def train_step(self, data):
+        logs = super(EvaluationModel, self).train_step(data)
+        if hasattr(self, 'ground_distance_manager'):
+            # Features of the training forward pass, read by the ground distance manager after each batch.
+            self.ground_distance_manager.batch_class_features.assign(tf.cast(self.second_to_last_layer, tf.float32))
+        return logs
+
     def _compile_model(
             self,
             loss_function: Callable,
-            ground_distance_path: Path,
             **loss_function_kwargs
     ):
-        if loss_function == self_guided_earth_mover_distance:
-            self.emd_weight_head_start = EmdWeightHeadStart()
-            self.ground_distance_manager = GroundDistanceManager(ground_distance_path)
         lr_schedule = ExponentialDecay(
             self.learning_rate,
             decay_steps=429,
@@ -106,35 +128,22 @@ class EvaluationModel(ABC, Model):
                 model=self,
                 **loss_function_kwargs
             ),
-            optimizer=self._OPTIMIZER(
-                learning_rate=lr_schedule,
-                nesterov=True,
-                momentum=self._OPTIMIZER_MOMENTUM
+            optimizer=tf.keras.mixed_precision.experimental.LossScaleOptimizer(
+                self._OPTIMIZER(
+                    learning_rate=lr_schedule,
+                    nesterov=True,
+                    momentum=self._OPTIMIZER_MOMENTUM
+                ),
+                loss_scale='dynamic'
             ),
-            metrics=self._METRICS,
-            run_eagerly=True
+            metrics=self._METRICS
         )
 
     def test(self, **kwargs):
         return self.predict(**kwargs)
 
     def train(self, **kwargs):
-        callbacks = [
-            get_checkpoint_file(
-                loss_name=self.loss_function.__name__,
-                data_set_name=self.dataset_name,
-                learning_rate=self.learning_rate,
-                model_name=self._MODEL_NAME,
-                fold_index=self.fold_index
-            ),
-            get_tensorboard_callback(
-                loss_name=self.loss_function.__name__,
-                data_set_name=self.dataset_name,
-                learning_rate=self.learning_rate,
-                model_name=self._MODEL_NAME,
-                fold_index=self.fold_index
-            )
-        ]
+        callbacks = [self.checkpoint_callback, self.tensorboard_callback] + kwargs.pop('callbacks', [])
         if hasattr(self, 'ground_distance_manager'):
             labels = [batch[1] for batch in kwargs['x']]
             self.ground_distance_manager.set_labels(labels)
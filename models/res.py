@@ -1,10 +1,8 @@
 from typing import Union, ClassVar
 
-import numpy as np
-
 from tensorflow.keras.activations import softmax, linear
+from tensorflow.keras import Sequential
 from tensorflow.keras.layers import Conv2D, Layer, BatchNormalization, Dense, ReLU, AvgPool2D, Flatten
-from tensorflow import TensorShape
 
 from models.evaluation_model import EvaluationModel
 
@@ -27,7 +25,7 @@ class Res(EvaluationModel):
             input_shape=(227, 227, 3)
         )
         self.flatten = Flatten()
-        self.dense3 = Dense(number_of_classes, activation=final_activation)
+        self.dense3 = Dense(number_of_classes, activation=final_activation, dtype='float32')
 
 
 class Resf(EvaluationModel):
@@ -44,26 +42,12 @@ class Resf(EvaluationModel):
 
 class BasicLayer(Layer):
 
-    def __init__(self, sub_layers, stride, filters, k, **kwargs):
+    def __init__(self, sub_layers, **kwargs):
         super(BasicLayer, self).__init__(**kwargs)
-        self.sub_layers = sub_layers
-        self.stride = stride
-        self.filters = filters
-        self.k = k
+        self.sub_layers = Sequential(sub_layers)
 
     def call(self, inputs, **kwargs):
-        x = self.sub_layers[0](inputs, **kwargs)
-        for layer in self.sub_layers[1:]:
-            x = layer(x, **kwargs)
-        return x
-
-    def compute_output_shape(self, input_shape):
-        return TensorShape((
-            input_shape[0],
-            input_shape[1] // self.stride,
-            input_shape[2] // self.stride,
-            self.filters * self.k
-        ))
+        return self.sub_layers(inputs, training=kwargs.get('training'))
 
 
 class ConvolutionBlock(BasicLayer):
@@ -80,18 +64,12 @@ class ConvolutionBlock(BasicLayer):
                     padding='same'
                 )
             ],
-            stride=stride,
-            filters=filters,
-            k=k,
             **kwargs
         )
 
     def call(self, inputs, **kwargs):
         return super(ConvolutionBlock, self).call(inputs, **kwargs)
 
-    def compute_output_shape(self, input_shape):
-        return super(ConvolutionBlock, self).compute_output_shape(input_shape)
-
 
 class BottleneckBlock(BasicLayer):
 
@@ -115,18 +93,12 @@ class BottleneckBlock(BasicLayer):
                     activation=activation
                 )
             ],
-            stride=stride,
-            filters=filters,
-            k=k,
             **kwargs
         )
 
     def call(self, inputs, **kwargs):
         return super(BottleneckBlock, self).call(inputs, **kwargs)
 
-    def compute_output_shape(self, input_shape):
-        return super(BottleneckBlock, self).compute_output_shape(input_shape)
-
 
 class Group(BasicLayer):
 
@@ -134,18 +106,12 @@ class Group(BasicLayer):
         super(Group, self).__init__(
             sub_layers=[BottleneckBlock(filters, stride, activation, k)]
             + [BottleneckBlock(filters, activation=activation, k=k) for _ in range(n - 1)],
-            stride=stride,
-            filters=filters,
-            k=k,
             **kwargs
         )
 
     def call(self, inputs, **kwargs):
         return super(Group, self).call(inputs, **kwargs)
 
-    def compute_output_shape(self, input_shape):
-        return super(Group, self).compute_output_shape(input_shape)
-
 
 class WideResidualNetwork(Layer):
 
@@ -153,7 +119,7 @@ class WideResidualNetwork(Layer):
     STRIDES = [4, 1, 2, 2]
 
     def __init__(self, input_shape, group_size, pool_size=8, activation=ReLU, k=1, **kwargs):
-        super(WideResidualNetwork, self).__init__(input_shape=input_shape, dynamic=True, **kwargs)
+        super(WideResidualNetwork, self).__init__(**kwargs)
         self.groups = [
             Conv2D(
                 input_shape=input_shape,
@@ -174,19 +140,9 @@ class WideResidualNetwork(Layer):
             for i in range(1, len(WideResidualNetwork.FILTER_SIZES))
         ])
         self.groups.append(AvgPool2D(pool_size=pool_size))
-        self.pool_size = pool_size
 
     def call(self, inputs, **kwargs):
         x = self.groups[0](inputs)
         for group in self.groups[1:]:
             x = group(x)
         return x
-
-    def compute_output_shape(self, input_shape):
-        stride_product = np.product(WideResidualNetwork.STRIDES)
-        return TensorShape((
-            input_shape[0],
-            input_shape[1] // (stride_product * self.pool_size),
-            input_shape[2] // (stride_product * self.pool_size),
-            WideResidualNetwork.FILTER_SIZES[-1]
-        ))
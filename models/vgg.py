@@ -27,4 +27,4 @@ class Vggf(EvaluationModel):
         )
         self.dense1 = Dense(4096, activation=relu)
         self.dense2 = Dense(4096, activation=relu)
-        self.dense3 = Dense(number_of_classes, activation=final_activation)
+        self.dense3 = Dense(number_of_classes, activation=final_activation, dtype='float32')
@@ -8,7 +8,7 @@ from evaluation.adience import evaluate_adience_model
 
 from loss_functions.crossentropy import cross_entropy
 from loss_functions.emd import earth_mover_distance, self_guided_earth_mover_distance, \
-    approximate_earth_mover_distance, GroundDistanceManager
+    approximate_earth_mover_distance, load_ground_distance_matrix
 from loss_functions.regression import l2_regression_loss
 from models.alx import Alxs
 from models.res import Res
@@ -165,8 +165,7 @@ class AdienceAemd1:
 
     @staticmethod
     def vggf(lr_index, fold_index):
-        ground_distance_manager = GroundDistanceManager(Path('ground_distances'))
-        ground_distance_matrix = ground_distance_manager.load_ground_distance_matrix('159')
+        ground_distance_matrix = load_ground_distance_matrix(Path('ground_distances'), '159')
         evaluate_adience_model(
             evaluation_model=Vggf,
             learning_rate_index=lr_index,
@@ -180,8 +179,7 @@ class AdienceAemd1:
 
     @staticmethod
     def res(lr_index, fold_index):
-        ground_distance_manager = GroundDistanceManager(Path('ground_distances'))
-        ground_distance_matrix = ground_distance_manager.load_ground_distance_matrix('159')
+        ground_distance_matrix = load_ground_distance_matrix(Path('ground_distances'), '159')
         evaluate_adience_model(
             evaluation_model=Res,
             learning_rate_index=lr_index,
@@ -195,8 +193,7 @@ class AdienceAemd1:
 
     @staticmethod
     def alxs(lr_index, fold_index):
-        ground_distance_manager = GroundDistanceManager(Path('ground_distances'))
-        ground_distance_matrix = ground_distance_manager.load_ground_distance_matrix('159')
+        ground_distance_matrix = load_ground_distance_matrix(Path('ground_distances'), '159')
         evaluate_adience_model(
             evaluation_model=Alxs,
             learning_rate_index=lr_index,
@@ -214,8 +211,7 @@ class AdienceAemd2:
 
     @staticmethod
     def vggf(lr_index, fold_index):
-        ground_distance_manager = GroundDistanceManager(Path('ground_distances'))
-        ground_distance_matrix = ground_distance_manager.load_ground_distance_matrix('159')
+        ground_distance_matrix = load_ground_distance_matrix(Path('ground_distances'), '159')
         evaluate_adience_model(
             evaluation_model=Vggf,
             learning_rate_index=lr_index,
@@ -229,8 +225,7 @@ class AdienceAemd2:
 
     @staticmethod
     def res(lr_index, fold_index):
-        ground_distance_manager = GroundDistanceManager(Path('ground_distances'))
-        ground_distance_matrix = ground_distance_manager.load_ground_distance_matrix('159')
+        ground_distance_matrix = load_ground_distance_matrix(Path('ground_distances'), '159')
         evaluate_adience_model(
             evaluation_model=Res,
             learning_rate_index=lr_index,
@@ -244,8 +239,7 @@ class AdienceAemd2:
 
     @staticmethod
     def alxs(lr_index, fold_index):
-        ground_distance_manager = GroundDistanceManager(Path('ground_distances'))
-        ground_distance_matrix = ground_distance_manager.load_ground_distance_matrix('159')
+        ground_distance_matrix = load_ground_distance_matrix(Path('ground_distances'), '159')
         evaluate_adience_model(
             evaluation_model=Alxs,
             learning_rate_index=lr_index,
@@ -263,8 +257,7 @@ class AdienceAemd3:
 
     @staticmethod
     def vggf(lr_index, fold_index):
-        ground_distance_manager = GroundDistanceManager(Path('ground_distances'))
-        ground_distance_matrix = ground_distance_manager.load_ground_distance_matrix('159')
+        ground_distance_matrix = load_ground_distance_matrix(Path('ground_distances'), '159')
         evaluate_adience_model(
             evaluation_model=Vggf,
             learning_rate_index=lr_index,
@@ -278,8 +271,7 @@ class AdienceAemd3:
 
     @staticmethod
     def res(lr_index, fold_index):
-        ground_distance_manager = GroundDistanceManager(Path('ground_distances'))
-        ground_distance_matrix = ground_distance_manager.load_ground_distance_matrix('159')
+        ground_distance_matrix = load_ground_distance_matrix(Path('ground_distances'), '159')
         evaluate_adience_model(
             evaluation_model=Res,
             learning_rate_index=lr_index,
@@ -293,8 +285,7 @@ class AdienceAemd3:
 
     @staticmethod
     def alxs(lr_index, fold_index):
-        ground_distance_manager = GroundDistanceManager(Path('ground_distances'))
-        ground_distance_matrix = ground_distance_manager.load_ground_distance_matrix('159')
+        ground_distance_matrix = load_ground_distance_matrix(Path('ground_distances'), '159')
         evaluate_adience_model(
             evaluation_model=Alxs,
             learning_rate_index=lr_index,